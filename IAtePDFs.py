@@ -1,27 +1,377 @@
 #!/usr/bin/env python3
 
 import gi
+import hashlib
+import io
+import multiprocessing
 import os
 import sys
 import shutil
 import threading
-import tempfile
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Gdk, Gio, GLib, Adw, GdkPixbuf, GObject
+from gi.repository import Gtk, Gdk, Gio, GLib, Adw, GObject
 
 # Import PDF manipulation libraries
 try:
     from pypdf import PdfWriter, PdfReader
-    from pdf2image import convert_from_path
+    from pypdf.generic import ArrayObject, NameObject, NumberObject
+    import fitz  # PyMuPDF
 except ImportError as e:
     print(f"Error: Missing required Python library '{e.name}'.")
-    print(f"Please install it using: pip install {e.name} pypdf pdf2image")
+    print(f"Please install it using: pip install {e.name} pypdf PyMuPDF")
     exit(1)
 
+# Optional in-process compression backend; Ghostscript remains the fallback.
+try:
+    import pikepdf
+    from PIL import Image
+    HAS_PIKEPDF = True
+except ImportError:
+    HAS_PIKEPDF = False
+
+# Resolve Ghostscript once instead of walking $PATH per compression call.
+GS_PATH = shutil.which("gs")
+
+# Bounded pool for preview rendering: one OS thread per widget oversubscribes
+# the CPU badly on large PDFs, so all preview jobs share this executor instead.
+PREVIEW_POOL = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) - 1))
+
+_CSS = (
+    b".card { border-radius: 8px; border: 1px solid silver; "
+    b"background-color: white; margin: 6px; }"
+    b".selected-row { background-color: alpha(@accent_color, 0.1); }"
+)
+_css_registered = False
+
+def _register_css():
+    """Parse and register the application CSS once per process."""
+    global _css_registered
+    if _css_registered:
+        return
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_data(_CSS)
+    Gtk.StyleContext.add_provider_for_display(
+        Gdk.Display.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _css_registered = True
+
+# Rendered-thumbnail cache keyed by (path, mtime, page_index, width) so
+# re-selecting a PDF does not re-read and re-decode its content streams.
+# Entries also persist under the user cache dir so thumbnails survive
+# across sessions; mtime in the key invalidates edited files.
+_THUMB_CACHE = {}
+_THUMB_CACHE_MAX = 512
+# PREVIEW_POOL workers and the UI thread mutate the cache concurrently;
+# unguarded eviction can race to pop the same key and raise KeyError.
+_THUMB_CACHE_LOCK = threading.Lock()
+
+def _thumb_cache_store(key, thumb):
+    """Insert into the in-memory cache, evicting the oldest entry at the cap."""
+    with _THUMB_CACHE_LOCK:
+        if len(_THUMB_CACHE) >= _THUMB_CACHE_MAX:
+            _THUMB_CACHE.pop(next(iter(_THUMB_CACHE)), None)
+        _THUMB_CACHE[key] = thumb
+
+def _thumb_cache_clear():
+    with _THUMB_CACHE_LOCK:
+        _THUMB_CACHE.clear()
+
+_DISK_CACHE_DIR = os.path.join(GLib.get_user_cache_dir(), "iatepdfs", "thumbs")
+_DISK_CACHE_LIMIT = 200 * 1024 * 1024  # bytes
+
+def _disk_cache_path(key):
+    digest = hashlib.sha1("|".join(map(str, key)).encode()).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f"{digest}.rgb")
+
+def _disk_cache_get(key):
+    """Load a thumbnail written by a previous session, or None."""
+    try:
+        with open(_disk_cache_path(key), "rb") as f:
+            width, height, stride = map(int, f.readline().split())
+            samples = f.read()
+    except (OSError, ValueError):
+        return None
+    if len(samples) != height * stride:
+        return None  # truncated or tampered entry; re-render instead
+    return samples, width, height, stride
+
+def _disk_cache_put(key, thumb):
+    samples, width, height, stride = thumb
+    path = _disk_cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(f"{width} {height} {stride}\n".encode())
+            f.write(samples)
+        # os.replace is atomic, so readers never see a half-written entry.
+        os.replace(tmp_path, path)
+    except OSError:
+        # A full or read-only cache dir is not worth failing a preview.
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _trim_disk_cache():
+    """Drop the oldest on-disk thumbnails once the directory exceeds its budget."""
+    try:
+        with os.scandir(_DISK_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                     for entry in entries if entry.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    for mtime, size, path in sorted(files):
+        if total <= _DISK_CACHE_LIMIT:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+def _lookup_thumb(key):
+    """Check the in-memory cache, then the on-disk cache (promoting hits)."""
+    thumb = _THUMB_CACHE.get(key)
+    if thumb is None:
+        thumb = _disk_cache_get(key)
+        if thumb is not None:
+            _thumb_cache_store(key, thumb)
+    return thumb
+
+def _cache_thumb(key, pix):
+    """Store a rendered pixmap's raw samples in both thumbnail caches."""
+    thumb = (bytes(pix.samples), pix.width, pix.height, pix.stride)
+    _thumb_cache_store(key, thumb)
+    _disk_cache_put(key, thumb)
+    return thumb
+
+def _write_split_pages(input_path, output_dir, base_name, indices):
+    """Write one single-page PDF per index (runs in a worker process)."""
+    with open(input_path, "rb", buffering=1 << 20) as src:
+        reader = PdfReader(src)
+        for i in indices:
+            writer = PdfWriter()
+            writer.add_page(reader.pages[i])
+            output_filename = os.path.join(output_dir, f"{base_name}_page_{i + 1}.pdf")
+            with open(output_filename, "wb") as f:
+                writer.write(f)
+
+# Quality preset -> (max image dimension, JPEG quality), mirroring the
+# intent of Ghostscript's /screen../prepress PDFSETTINGS.
+COMPRESSION_PRESETS = {
+    "screen": (1024, 50),
+    "ebook": (1536, 75),
+    "printer": (2048, 90),
+    "prepress": (4096, 95),
+}
+
+def _format_size(n_bytes):
+    """Format a byte count for toasts, e.g. 12.3 MB."""
+    for unit in ("B", "KB", "MB"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.1f} {unit}" if unit != "B" else f"{n_bytes} B"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} GB"
+
+def compress_pdf(input_path, output_path, quality="ebook"):
+    """Compress a PDF in-process with pikepdf, falling back to Ghostscript."""
+    if HAS_PIKEPDF:
+        try:
+            success, message = _compress_pdf_pikepdf(input_path, output_path, quality)
+        except Exception as e:
+            print(f"pikepdf compression failed, falling back to Ghostscript: {e}")
+            success, message = _compress_pdf_gs(input_path, output_path, quality)
+    else:
+        success, message = _compress_pdf_gs(input_path, output_path, quality)
+
+    if success:
+        # Stat both files here in the worker so the UI callback touches
+        # no filesystem.
+        try:
+            in_size = os.stat(input_path).st_size
+            out_size = os.stat(output_path).st_size
+            if out_size >= in_size:
+                # Recompressing an already-compact file made it bigger;
+                # ship the original bytes and say so instead of claiming a win.
+                with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+                message = (f"File is already compact "
+                           f"({_format_size(in_size)}); saved unchanged.")
+            else:
+                message = (f"Compression successful "
+                           f"({_format_size(in_size)} → {_format_size(out_size)}).")
+        except OSError:
+            pass
+    return success, message
+
+def _compress_pdf_pikepdf(input_path, output_path, quality):
+    """Downscale and re-encode embedded images without spawning a process."""
+    max_dim, jpeg_quality = COMPRESSION_PRESETS[quality]
+    with pikepdf.open(input_path) as pdf:
+        for page in pdf.pages:
+            for raw_image in list(page.images.values()):
+                if raw_image.get("/BitsPerComponent", 8) == 1:
+                    # 1-bit scans (CCITT/JBIG2) are already compact;
+                    # re-encoding them as 8-bit JPEG inflates the file.
+                    continue
+                try:
+                    img = pikepdf.PdfImage(raw_image).as_pil_image().convert("RGB")
+                except Exception:
+                    continue  # leave images we cannot decode untouched
+                if max(img.size) > max_dim:
+                    img.thumbnail((max_dim, max_dim))
+                buffer = io.BytesIO()
+                img.save(buffer, format="JPEG", quality=jpeg_quality)
+                if len(buffer.getvalue()) >= len(raw_image.read_raw_bytes()):
+                    continue  # the re-encode did not win; keep the original stream
+                raw_image.write(buffer.getvalue(), filter=pikepdf.Name("/DCTDecode"))
+                raw_image.Width, raw_image.Height = img.width, img.height
+                raw_image.ColorSpace = pikepdf.Name("/DeviceRGB")
+                raw_image.BitsPerComponent = 8
+        pdf.save(output_path, compress_streams=True,
+                 object_stream_mode=pikepdf.ObjectStreamMode.generate)
+    return True, "Compression successful."
+
+def _compress_pdf_gs(input_path, output_path, quality="ebook"):
+    """Compress PDF using Ghostscript."""
+    if not GS_PATH:
+        return False, "Error: Ghostscript (gs) is not installed or not in your PATH."
+    try:
+        command = [
+            GS_PATH, "-sDEVICE=pdfwrite", "-dCompatibilityLevel=1.4",
+            f"-dPDFSETTINGS=/{quality}", "-dNOPAUSE", "-dQUIET", "-dBATCH",
+            f"-dNumRenderingThreads={os.cpu_count()}",
+            "-dBufferSpace=200000000", "-dBandHeight=100",
+            f"-sOutputFile={output_path}", input_path
+        ]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE, text=True)
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            return False, f"Ghostscript failed: {stderr}"
+        return True, "Compression successful."
+    except FileNotFoundError:
+        return False, "Error: Ghostscript (gs) is not installed or not in your PATH."
+
+def split_pdf(input_path, output_dir):
+    """Split PDF into individual pages, spreading page ranges over worker processes."""
+    try:
+        with open(input_path, "rb", buffering=1 << 20) as src:
+            n_pages = len(PdfReader(src).pages)
+        base_name = Path(input_path).stem
+        os.makedirs(output_dir, exist_ok=True)
+
+        n_workers = min(os.cpu_count() or 1, n_pages)
+        if n_workers <= 1 or n_pages < 8:
+            # Not enough pages to amortize process startup.
+            _write_split_pages(input_path, output_dir, base_name, range(n_pages))
+        else:
+            chunk = -(-n_pages // n_workers)  # ceil division
+            ranges = [range(start, min(start + chunk, n_pages))
+                      for start in range(0, n_pages, chunk)]
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(_write_split_pages, input_path, output_dir,
+                                       base_name, page_range)
+                           for page_range in ranges]
+                for future in futures:
+                    future.result()
+
+        return True, f"Successfully split into {n_pages} pages."
+    except Exception as e:
+        return False, f"Failed to split PDF: {e}"
+
+def merge_pdfs(pdf_paths, output_path):
+    """Merge multiple PDF files."""
+    try:
+        if len(pdf_paths) == 1:
+            # A one-file "merge" is a plain copy; skip the parse/serialize
+            # round-trip and let the kernel move the bytes.
+            with open(pdf_paths[0], "rb") as src, open(output_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+            return True, "Successfully merged 1 file."
+        with PdfWriter() as merger:
+            for path in pdf_paths:
+                merger.append(path)
+            merger.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+            # A 1 MiB buffer keeps pypdf's many small writes off the disk.
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                merger.write(f)
+        return True, f"Successfully merged {len(pdf_paths)} files."
+    except Exception as e:
+        return False, f"Failed to merge PDFs: {e}"
+
+def reorder_pdf_pages(input_path, output_path, new_order_indices):
+    """Reorder PDF pages."""
+    try:
+        with open(input_path, "rb", buffering=1 << 20) as src:
+            writer = PdfWriter(clone_from=src)
+            pages_root = writer._pages.get_object()
+            kids = pages_root["/Kids"]
+            if len(kids) == len(writer.pages):
+                # Flat page tree: reordering is just a permutation of /Kids,
+                # so no content stream has to be copied or re-encoded.
+                pages_root[NameObject("/Kids")] = ArrayObject(kids[i] for i in new_order_indices)
+                pages_root[NameObject("/Count")] = NumberObject(len(new_order_indices))
+                if len(new_order_indices) < len(kids):
+                    # Dropped pages are now orphaned clones; sweep them so
+                    # their content streams do not survive in the output.
+                    writer.compress_identical_objects(remove_identicals=True,
+                                                      remove_orphans=True)
+            else:
+                # Nested page tree: fall back to copying the kept pages in
+                # the new order, in one resolve-once append pass.
+                src.seek(0)
+                reader = PdfReader(src)
+                writer = PdfWriter()
+                writer.append(reader, pages=new_order_indices)
+                writer.compress_identical_objects(remove_identicals=True, remove_orphans=False)
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                writer.write(f)
+        return True, "Successfully reordered pages."
+    except Exception as e:
+        return False, f"Failed to reorder PDF: {e}"
+
+def _texture_from_thumb(samples, width, height, stride):
+    """Wrap raw RGB samples in a Gdk.MemoryTexture without any disk round-trip."""
+    return Gdk.MemoryTexture.new(
+        width, height, Gdk.MemoryFormat.R8G8B8, GLib.Bytes.new(samples), stride
+    )
+
+class TexturePool:
+    """A fixed-size LRU of Gdk.Textures, so map/unmap cycles and row
+    recycling reuse the same texture instead of re-wrapping cached samples."""
+    def __init__(self, cap=128):
+        self._cap = cap
+        self._lru = OrderedDict()
+        # Worker threads get/put while the UI thread may clear.
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            texture = self._lru.pop(key, None)
+            if texture is not None:
+                self._lru[key] = texture
+            return texture
+
+    def put(self, key, texture):
+        with self._lock:
+            self._lru.pop(key, None)
+            self._lru[key] = texture
+            while len(self._lru) > self._cap:
+                self._lru.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+
 class DraggableMixin:
     """A mixin class to provide drag-and-drop functionality for reordering."""
     def setup_dnd(self, widget):
@@ -52,74 +402,119 @@ class DraggableMixin:
     def _on_drop(self, target, value, x, y):
         raise NotImplementedError
 
-class PdfFileRow(Gtk.ListBoxRow, DraggableMixin):
-    """A reorderable row for a PDF file in the merge list."""
-    def __init__(self, file_path, app_window):
+class PdfItem(GObject.Object):
+    """Model object for a PDF file in the merge list."""
+    def __init__(self, file_path):
         super().__init__()
         self.file_path = file_path
+
+class PdfFileRow(Gtk.Box, DraggableMixin):
+    """A factory-built row for a PDF file in the merge list, recycled across items."""
+    def __init__(self, app_window):
+        super().__init__()
+        self.item = None
         self.app_window = app_window
 
-        action_row = Adw.ActionRow(title=os.path.basename(file_path), subtitle=str(Path(file_path).parent))
-        self.set_child(action_row)
+        self.action_row = Adw.ActionRow(hexpand=True)
+        self.append(self.action_row)
 
         # Preview stack
-        preview_stack = Gtk.Stack()
+        self.preview_stack = Gtk.Stack()
         self.preview_image = Gtk.Picture(width_request=40, height_request=55)
         self.preview_spinner = Gtk.Spinner(spinning=True)
-        preview_stack.add_named(self.preview_spinner, "loading")
-        preview_stack.add_named(self.preview_image, "done")
-        preview_stack.set_visible_child_name("loading")
-        action_row.add_prefix(preview_stack)
+        self.preview_stack.add_named(self.preview_spinner, "loading")
+        self.preview_stack.add_named(self.preview_image, "done")
+        self.preview_stack.set_visible_child_name("loading")
+        self.action_row.add_prefix(self.preview_stack)
 
         # Remove button
         remove_button = Gtk.Button(icon_name="edit-delete-symbolic", valign=Gtk.Align.CENTER)
         remove_button.connect("clicked", self._on_remove_clicked)
-        action_row.add_suffix(remove_button)
+        self.action_row.add_suffix(remove_button)
 
         self.setup_dnd(self)
-        threading.Thread(target=self._generate_preview, args=(preview_stack,)).start()
+
+    def bind(self, item):
+        """Point this (possibly recycled) row at a new model item."""
+        self.item = item
+        parent, base = os.path.split(item.file_path)
+        self.action_row.set_title(base)
+        self.action_row.set_subtitle(parent)
+        self.preview_stack.set_visible_child_name("loading")
+        # Render exactly the pixels the 40px-wide picture will display,
+        # accounting for HiDPI scaling.
+        PREVIEW_POOL.submit(self._generate_preview, item, 40 * self.get_scale_factor())
+
+    def _on_drag_prepare(self, source, x, y):
+        widget = source.get_widget()
+        paintable = Gtk.WidgetPaintable(widget=widget)
+        source.set_icon(paintable, x, y)
+        value = GObject.Value(GObject.TYPE_OBJECT, self.item)
+        return Gdk.ContentProvider.new_for_value(value)
 
     def _on_drop(self, target, value, x, y):
-        source_row, target_row = value, self
-        list_box = target_row.get_parent()
-        if source_row is target_row or not isinstance(list_box, Gtk.ListBox): 
+        # Dropped value is the dragged PdfItem; reorder happens in the model,
+        # no widget is destroyed or rebuilt.
+        store = self.app_window.merge_store
+        if not isinstance(value, PdfItem) or value is self.item or self.item is None:
             return True
 
-        target_index = target_row.get_index()
-        list_box.remove(source_row)
-        list_box.insert(source_row, target_index)
+        found_src, source_index = store.find(value)
+        found_dst, target_index = store.find(self.item)
+        if not (found_src and found_dst):
+            return True
+
+        store.remove(source_index)
+        store.insert(target_index, value)
         return True
 
-    def _generate_preview(self, stack):
+    def _generate_preview(self, item, render_width):
         try:
-            with tempfile.TemporaryDirectory() as temp_path:
-                images = convert_from_path(self.file_path, dpi=72, first_page=1, last_page=1, 
-                                         output_folder=temp_path, fmt='png', size=(60, None))
-                if images:
-                    texture = Gdk.Texture.new_from_filename(images[0].filename)
-                    GLib.idle_add(self._set_preview_image, texture, stack)
+            key = (item.file_path, os.path.getmtime(item.file_path), 0, render_width)
+            texture_pool = self.app_window._texture_pool
+            texture = texture_pool.get(key)
+            if texture is None:
+                thumb = _lookup_thumb(key)
+                if thumb is None:
+                    doc = fitz.open(item.file_path)
+                    try:
+                        page = doc.load_page(0)
+                        scale = render_width / page.rect.width
+                        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                        thumb = _cache_thumb(key, pix)
+                    finally:
+                        doc.close()
+                texture = _texture_from_thumb(*thumb)
+                texture_pool.put(key, texture)
+            GLib.idle_add(self._set_preview_image, item, texture)
         except Exception as e:
-            print(f"Could not generate preview for {self.file_path}: {e}")
-            GLib.idle_add(self._set_preview_error, stack)
+            print(f"Could not generate preview for {item.file_path}: {e}")
+            GLib.idle_add(self._set_preview_error, item)
 
-    def _set_preview_image(self, texture, stack):
-        self.preview_image.set_paintable(texture)
-        stack.set_visible_child_name("done")
+    def _set_preview_image(self, item, texture):
+        if self.item is item:  # row may have been recycled while rendering
+            self.preview_image.set_paintable(texture)
+            self.preview_stack.set_visible_child_name("done")
 
-    def _set_preview_error(self, stack):
-        self.preview_image.set_icon_name("image-missing-symbolic")
-        self.preview_image.set_pixel_size(48)
-        stack.set_visible_child_name("done")
+    def _set_preview_error(self, item):
+        if self.item is item:
+            self.preview_image.set_icon_name("image-missing-symbolic")
+            self.preview_image.set_pixel_size(48)
+            self.preview_stack.set_visible_child_name("done")
 
     def _on_remove_clicked(self, button):
-        self.get_parent().remove(self)
+        store = self.app_window.merge_store
+        found, index = store.find(self.item)
+        if found:
+            store.remove(index)
         self.app_window.update_ui_state()
 
 class PdfPageWidget(Gtk.FlowBoxChild, DraggableMixin):
     """A widget representing a single, reorderable PDF page with delete functionality."""
-    def __init__(self, pdf_path, page_index):
+    def __init__(self, page_index, app_window):
         super().__init__()
         self.original_page_index = page_index
+        self.app_window = app_window
         self.is_deleted = False
 
         overlay = Gtk.Overlay()
@@ -131,14 +526,14 @@ class PdfPageWidget(Gtk.FlowBoxChild, DraggableMixin):
         overlay.set_child(self.content_box)
 
         # Preview
-        preview_stack = Gtk.Stack()
+        self.preview_stack = Gtk.Stack()
         self.preview_image = Gtk.Picture(width_request=60, height_request=84)
         self.preview_spinner = Gtk.Spinner(spinning=True)
-        preview_stack.add_named(self.preview_spinner, "loading")
-        preview_stack.add_named(self.preview_image, "done")
-        preview_stack.set_visible_child_name("loading")
+        self.preview_stack.add_named(self.preview_spinner, "loading")
+        self.preview_stack.add_named(self.preview_image, "done")
+        self.preview_stack.set_visible_child_name("loading")
 
-        self.content_box.append(preview_stack)
+        self.content_box.append(self.preview_stack)
         self.content_box.append(Gtk.Label(label=f"Page {page_index + 1}"))
 
         # Delete toggle button
@@ -150,7 +545,24 @@ class PdfPageWidget(Gtk.FlowBoxChild, DraggableMixin):
         overlay.add_overlay(delete_button)
 
         self.setup_dnd(self)
-        threading.Thread(target=self._generate_page_preview, args=(pdf_path, preview_stack)).start()
+
+        # Defer rendering until the widget is actually realized on screen,
+        # and release the texture again while it is not.
+        self._preview_requested = False
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
+
+    def _on_map(self, widget):
+        if not self._preview_requested:
+            self._preview_requested = True
+            self.app_window.request_page_preview(self)
+
+    def _on_unmap(self, widget):
+        # Remapping re-requests the render, which normally hits the
+        # thumbnail cache, so off-screen pages cost no texture memory.
+        self.preview_image.set_paintable(None)
+        self.preview_stack.set_visible_child_name("loading")
+        self._preview_requested = False
 
     def _on_delete_toggled(self, button):
         self.is_deleted = button.get_active()
@@ -168,30 +580,21 @@ class PdfPageWidget(Gtk.FlowBoxChild, DraggableMixin):
         target_index = target_container.get_index()
         flow_box.remove(source_container)
         flow_box.insert(source_container, target_index)
-        return True
 
-    def _generate_page_preview(self, pdf_path, stack):
-        try:
-            with tempfile.TemporaryDirectory() as temp_path:
-                images = convert_from_path(pdf_path, dpi=96, 
-                                         first_page=self.original_page_index + 1, 
-                                         last_page=self.original_page_index + 1, 
-                                         output_folder=temp_path, fmt='png', size=(90, 125))
-                if images:
-                    texture = Gdk.Texture.new_from_filename(images[0].filename)
-                    GLib.idle_add(self._set_preview_image, texture, stack)
-        except Exception as e:
-            print(f"Error generating preview for page {self.original_page_index + 1}: {e}")
-            GLib.idle_add(self._set_preview_error, stack)
+        # Mirror the move in the window's ordered widget list.
+        page_widgets = self.app_window._page_widgets
+        page_widgets.remove(source_container)
+        page_widgets.insert(target_index, source_container)
+        return True
 
-    def _set_preview_image(self, texture, stack):
+    def set_preview_texture(self, texture):
         self.preview_image.set_paintable(texture)
-        stack.set_visible_child_name("done")
+        self.preview_stack.set_visible_child_name("done")
 
-    def _set_preview_error(self, stack):
+    def set_preview_error(self):
         self.preview_image.set_icon_name("image-missing-symbolic")
         self.preview_image.set_pixel_size(48)
-        stack.set_visible_child_name("done")
+        self.preview_stack.set_visible_child_name("done")
 
 class PdfToolWindow(Adw.ApplicationWindow):
     """The main application window."""
@@ -205,18 +608,29 @@ class PdfToolWindow(Adw.ApplicationWindow):
         self.loaded_pdfs = []  # For merge functionality
         self.selected_pdf = None  # Currently selected PDF for operations
         self.reorder_source_path = None  # For reorder functionality
+        self._page_widgets = []  # Ordered mirror of the reorder flow box children
+        self._ui_update_pending = False
+
+        # Document kept open for lazy page-preview rendering; fitz documents
+        # are not thread-safe, so all access goes through the lock.
+        self._reorder_doc = None
+        self._reorder_doc_path = None
+        self._reorder_doc_lock = threading.Lock()
+        self._preview_gen = 0  # Bumped when the reorder view changes; stale jobs bail
+
+        # Heavy pypdf/pikepdf work runs in worker processes so its Python
+        # bytecode loops never contend with the UI thread for the GIL.
+        # Forking this process would duplicate GTK and thread-pool state,
+        # so spawn the workers through a clean forkserver instead.
+        self._task_pool = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("forkserver")
+        )
+
+        self._texture_pool = TexturePool()
         self.compression_quality = "ebook"
 
-        # CSS styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(
-            b".card { border-radius: 8px; border: 1px solid silver; "
-            b"background-color: white; margin: 6px; }"
-            b".selected-row { background-color: alpha(@accent_color, 0.1); }"
-        )
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # CSS styling (parsed once per process, not per window)
+        _register_css()
 
         self.toast_overlay = Adw.ToastOverlay()
         self.set_content(self.toast_overlay)
@@ -275,10 +689,18 @@ class PdfToolWindow(Adw.ApplicationWindow):
         scrolled_merge = Gtk.ScrolledWindow()
         scrolled_merge.set_vexpand(True)
         scrolled_merge.set_min_content_height(200)
-        self.merge_list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
-        self.merge_list_box.add_css_class("boxed-list")
-        self.merge_list_box.connect("row-selected", self._on_file_selected)
-        scrolled_merge.set_child(self.merge_list_box)
+
+        self.merge_store = Gio.ListStore.new(PdfItem)
+        self.merge_selection = Gtk.SingleSelection.new(self.merge_store)
+        self.merge_selection.connect("notify::selected-item", self._on_file_selected)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_merge_row_setup)
+        factory.connect("bind", self._on_merge_row_bind)
+
+        self.merge_list_view = Gtk.ListView.new(self.merge_selection, factory)
+        self.merge_list_view.add_css_class("boxed-list")
+        scrolled_merge.set_child(self.merge_list_view)
         files_group.add(scrolled_merge)
 
         # Merge button at bottom of file list
@@ -449,11 +871,7 @@ class PdfToolWindow(Adw.ApplicationWindow):
     def _on_clear_clicked(self, button):
         """Clear all files and reset to launch state."""
         # Clear merge list
-        child = self.merge_list_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.merge_list_box.remove(child)
-            child = next_child
+        self.merge_store.remove_all()
 
         # Clear reorder view
         self._clear_reorder_view()
@@ -461,6 +879,8 @@ class PdfToolWindow(Adw.ApplicationWindow):
         # Reset state
         self.selected_pdf = None
         self.reorder_source_path = None
+        _thumb_cache_clear()
+        self._texture_pool.clear()
 
         # Reset to placeholder
         self.main_stack.set_visible_child_name("placeholder")
@@ -468,34 +888,27 @@ class PdfToolWindow(Adw.ApplicationWindow):
         self.update_ui_state()
 
     def _on_browse_clicked(self, button):
-        """Open file browser to select PDF files."""
-        dialog = Gtk.FileChooserDialog(
-            title="Select PDF Files",
-            transient_for=self,
-            action=Gtk.FileChooserAction.OPEN
-        )
-        dialog.add_buttons(
-            "_Cancel", Gtk.ResponseType.CANCEL,
-            "_Open", Gtk.ResponseType.ACCEPT
-        )
-        dialog.set_select_multiple(True)
-
-        # Add PDF filter
+        """Open the async file dialog to select PDF files."""
+        dialog = Gtk.FileDialog(title="Select PDF Files")
+        dialog.set_default_filter(self._make_pdf_filter())
+
+        def on_finished(dialog, result):
+            try:
+                files = dialog.open_multiple_finish(result)
+            except GLib.Error:
+                return  # dismissed
+            pdf_paths = [f.get_path() for f in files if f.get_path() and f.get_path().lower().endswith(".pdf")]
+            if pdf_paths:
+                self._handle_files(pdf_paths)
+
+        dialog.open_multiple(self, None, on_finished)
+
+    def _make_pdf_filter(self):
+        """Build the PDF mime-type filter used by the file dialogs."""
         file_filter = Gtk.FileFilter()
         file_filter.set_name("PDF files")
         file_filter.add_mime_type("application/pdf")
-        dialog.add_filter(file_filter)
-
-        def on_response(dialog, response):
-            if response == Gtk.ResponseType.ACCEPT:
-                files = dialog.get_files()
-                pdf_paths = [f.get_path() for f in files if f.get_path().lower().endswith(".pdf")]
-                if pdf_paths:
-                    self._handle_files(pdf_paths)
-            dialog.destroy()
-
-        dialog.connect("response", on_response)
-        dialog.present()
+        return file_filter
 
     def _on_drop(self, drop_target, value, x, y):
         """Handle drag and drop of files."""
@@ -514,42 +927,50 @@ class PdfToolWindow(Adw.ApplicationWindow):
         """Handle opened/dropped PDF files."""
         self.main_stack.set_visible_child_name("content")
 
-        # Add to merge list
-        for path in pdf_paths:
-            self._add_pdf_to_merge_list(path)
-
-        # Auto-select the first file if none selected
-        if not self.selected_pdf and pdf_paths:
-            first_row = self.merge_list_box.get_row_at_index(0)
-            if first_row:
-                self.merge_list_box.select_row(first_row)
+        # One splice emits a single items-changed for the whole drop instead
+        # of one model notification (and ListView relayout) per file.
+        self.merge_store.splice(self.merge_store.get_n_items(), 0,
+                                [PdfItem(path) for path in pdf_paths])
 
+        # SingleSelection auto-selects the first item when the store was empty
         self.update_ui_state()
 
-    def _add_pdf_to_merge_list(self, file_path):
-        """Add a PDF to the merge list."""
-        row = PdfFileRow(file_path, self)
-        self.merge_list_box.append(row)
+    def _on_merge_row_setup(self, factory, list_item):
+        """Create a recyclable merge-list row widget."""
+        list_item.set_child(PdfFileRow(self))
 
-    def _on_file_selected(self, listbox, row):
+    def _on_merge_row_bind(self, factory, list_item):
+        """Bind a merge-list row widget to its model item."""
+        list_item.get_child().bind(list_item.get_item())
+
+    def _on_file_selected(self, selection, pspec):
         """Handle file selection for operations."""
-        if row is None:
+        item = selection.get_selected_item()
+        if item is None:
             self.selected_pdf = None
             self._clear_reorder_view()
             self.reorder_source_path = None
         else:
-            self.selected_pdf = row.file_path
-            self._load_pdf_for_reordering(row.file_path)
+            self.selected_pdf = item.file_path
+            self._load_pdf_for_reordering(item.file_path)
 
         self.update_ui_state()
 
     def _load_pdf_for_reordering(self, file_path):
         """Load PDF pages for reordering."""
         try:
-            reader = PdfReader(file_path)
-            if reader.is_encrypted:
-                self.toast_overlay.add_toast(Adw.Toast(title="Cannot load encrypted PDF."))
-                return
+            with open(file_path, "rb", buffering=1 << 20) as src:
+                reader = PdfReader(src)
+                if reader.is_encrypted:
+                    self.toast_overlay.add_toast(Adw.Toast(title="Cannot load encrypted PDF."))
+                    return
+
+                # /Count on the page tree root gives the page total without
+                # resolving every page object the way len(reader.pages) does.
+                try:
+                    n_pages = int(reader.trailer["/Root"]["/Pages"]["/Count"])
+                except (KeyError, TypeError, ValueError):
+                    n_pages = len(reader.pages)
 
             # Clear existing pages
             self._clear_reorder_view()
@@ -558,26 +979,83 @@ class PdfToolWindow(Adw.ApplicationWindow):
             filename = os.path.basename(file_path)
             self.reorder_subtitle.set_text(f"Reordering pages for: {filename}")
 
-            for i in range(len(reader.pages)):
-                page_widget = PdfPageWidget(file_path, i)
+            for i in range(n_pages):
+                page_widget = PdfPageWidget(i, self)
                 self.reorder_flow_box.append(page_widget)
+                self._page_widgets.append(page_widget)
 
         except Exception as e:
             self.toast_overlay.add_toast(Adw.Toast(title=f"Error reading PDF: {e}"))
 
+    def request_page_preview(self, page_widget):
+        """Queue a thumbnail render for a page widget that just became visible."""
+        if not self.reorder_source_path:
+            return
+        PREVIEW_POOL.submit(self._render_page_preview, self.reorder_source_path,
+                            page_widget, 60 * self.get_scale_factor(), self._preview_gen)
+
+    def _render_page_preview(self, file_path, page_widget, render_width, generation):
+        """Render one page thumbnail (runs on the preview pool)."""
+        if generation != self._preview_gen:
+            return  # the reorder view moved on while this job was queued
+        index = page_widget.original_page_index
+        try:
+            key = (file_path, os.path.getmtime(file_path), index, render_width)
+            texture = self._texture_pool.get(key)
+            if texture is not None:
+                GLib.idle_add(page_widget.set_preview_texture, texture)
+                return
+            thumb = _lookup_thumb(key)
+            if thumb is None:
+                with self._reorder_doc_lock:
+                    doc = self._reorder_doc
+                    if doc is None or self._reorder_doc_path != file_path:
+                        if doc is not None:
+                            doc.close()
+                        doc = fitz.open(file_path)
+                        self._reorder_doc = doc
+                        self._reorder_doc_path = file_path
+                    page = doc.load_page(index)
+                    scale = render_width / page.rect.width
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                thumb = _cache_thumb(key, pix)
+            if generation != self._preview_gen:
+                return
+            texture = _texture_from_thumb(*thumb)
+            self._texture_pool.put(key, texture)
+            GLib.idle_add(page_widget.set_preview_texture, texture)
+        except Exception as e:
+            print(f"Error generating preview for page {index + 1}: {e}")
+            GLib.idle_add(page_widget.set_preview_error)
+
     def _clear_reorder_view(self):
         """Clear the reorder view."""
+        self._preview_gen += 1
         child = self.reorder_flow_box.get_first_child()
         while child:
             next_child = child.get_next_sibling()
             self.reorder_flow_box.remove(child)
             child = next_child
 
+        self._page_widgets.clear()
+        with self._reorder_doc_lock:
+            if self._reorder_doc is not None:
+                self._reorder_doc.close()
+                self._reorder_doc = None
+                self._reorder_doc_path = None
         self.reorder_subtitle.set_text("Select a PDF file to reorder its pages")
 
     def update_ui_state(self):
+        """Schedule a UI state refresh; bursts of calls coalesce into one idle run."""
+        if self._ui_update_pending:
+            return
+        self._ui_update_pending = True
+        GLib.idle_add(self._flush_ui_update, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_ui_update(self):
         """Update the UI state based on loaded content."""
-        merge_count = len(self._get_all_children(self.merge_list_box))
+        self._ui_update_pending = False
+        merge_count = self.merge_store.get_n_items()
         has_selected_file = self.selected_pdf is not None
         has_reorder_content = self.reorder_source_path is not None
 
@@ -594,14 +1072,7 @@ class PdfToolWindow(Adw.ApplicationWindow):
             self.selected_pdf = None
             self.reorder_source_path = None
 
-    def _get_all_children(self, container):
-        """Get all children of a container."""
-        children = []
-        child = container.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-        return children
+        return False  # Remove from idle
 
     def _on_compress_clicked(self, button):
         """Handle compress button click."""
@@ -630,6 +1101,14 @@ class PdfToolWindow(Adw.ApplicationWindow):
         if not self.reorder_source_path:
             return
 
+        # An identity permutation with no deletions would just copy the file;
+        # skip the save dialog and the write entirely.
+        new_order_indices = [widget.original_page_index for widget in self._page_widgets
+                             if not widget.is_deleted]
+        if new_order_indices == list(range(len(self._page_widgets))):
+            self.toast_overlay.add_toast(Adw.Toast(title="Pages are unchanged — nothing to save."))
+            return
+
         source_path = Path(self.reorder_source_path)
         default_name = f"{source_path.stem}_reordered.pdf"
         self._show_save_dialog(default_name, self._run_reorder_task, source_path.parent)
@@ -639,175 +1118,86 @@ class PdfToolWindow(Adw.ApplicationWindow):
         self.compression_quality = combo.get_active_text()
 
     def _show_save_dialog(self, default_name, callback_on_accept, initial_dir=None):
-        """Show save file dialog."""
-        file_chooser = Gtk.FileChooserDialog(
-            title="Save As...", 
-            transient_for=self, 
-            action=Gtk.FileChooserAction.SAVE
-        )
-        file_chooser.add_buttons(
-            "_Cancel", Gtk.ResponseType.CANCEL, 
-            "_Save", Gtk.ResponseType.ACCEPT
-        )
-
-        file_filter = Gtk.FileFilter()
-        file_filter.set_name("PDF files")
-        file_filter.add_mime_type("application/pdf")
-        file_chooser.add_filter(file_filter)
-        file_chooser.set_current_name(default_name)
+        """Show the async save dialog."""
+        dialog = Gtk.FileDialog(title="Save As...", initial_name=default_name)
+        dialog.set_default_filter(self._make_pdf_filter())
 
         if initial_dir:
-            folder_file = Gio.File.new_for_path(str(initial_dir))
-            file_chooser.set_current_folder(folder_file)
+            dialog.set_initial_folder(Gio.File.new_for_path(str(initial_dir)))
 
-        def on_response(dialog, response):
-            if response == Gtk.ResponseType.ACCEPT:
-                callback_on_accept(dialog.get_file().get_path())
-            dialog.destroy()
+        def on_finished(dialog, result):
+            try:
+                gfile = dialog.save_finish(result)
+            except GLib.Error:
+                return  # dismissed
+            if gfile and gfile.get_path():
+                callback_on_accept(gfile.get_path())
 
-        file_chooser.connect("response", on_response)
-        file_chooser.present()
+        dialog.save(self, None, on_finished)
 
     def _show_folder_dialog(self, callback_on_accept, initial_dir=None):
-        """Show folder selection dialog."""
-        folder_chooser = Gtk.FileChooserDialog(
-            title="Select Output Folder", 
-            transient_for=self, 
-            action=Gtk.FileChooserAction.SELECT_FOLDER
-        )
-        folder_chooser.add_buttons(
-            "_Cancel", Gtk.ResponseType.CANCEL, 
-            "_Select", Gtk.ResponseType.ACCEPT
-        )
+        """Show the async folder selection dialog."""
+        dialog = Gtk.FileDialog(title="Select Output Folder")
 
         if initial_dir:
-            folder_file = Gio.File.new_for_path(str(initial_dir))
-            folder_chooser.set_current_folder(folder_file)
+            dialog.set_initial_folder(Gio.File.new_for_path(str(initial_dir)))
 
-        def on_response(dialog, response):
-            if response == Gtk.ResponseType.ACCEPT:
-                callback_on_accept(dialog.get_file().get_path())
-            dialog.destroy()
+        def on_finished(dialog, result):
+            try:
+                gfile = dialog.select_folder_finish(result)
+            except GLib.Error:
+                return  # dismissed
+            if gfile and gfile.get_path():
+                callback_on_accept(gfile.get_path())
 
-        folder_chooser.connect("response", on_response)
-        folder_chooser.present()
+        dialog.select_folder(self, None, on_finished)
 
     # Task execution methods
+    def _submit_task(self, func, *args, clear_merge=False):
+        """Run a PDF task in a worker process and marshal the result back to the UI."""
+        future = self._task_pool.submit(func, *args)
+
+        def on_done(f):
+            try:
+                success, message = f.result()
+            except Exception as e:
+                success, message = False, f"Task failed: {e}"
+            GLib.idle_add(self._on_task_finished, success, message, clear_merge)
+
+        future.add_done_callback(on_done)
+
     def _run_compress_task(self, output_path):
-        """Run compression task in background."""
+        """Run compression task in a worker process."""
         if not self.selected_pdf:
             return
 
-        input_path = self.selected_pdf
         self._set_processing_state(True, "Compressing PDF...")
-
-        def task():
-            success, message = self._compress_pdf(input_path, output_path, self.compression_quality)
-            GLib.idle_add(self._on_task_finished, success, message)
-
-        threading.Thread(target=task, daemon=True).start()
+        self._submit_task(compress_pdf, self.selected_pdf, output_path, self.compression_quality)
 
     def _run_split_task(self, output_dir):
-        """Run split task in background."""
+        """Run split task in a worker process."""
         if not self.selected_pdf:
             return
 
-        input_path = self.selected_pdf
         self._set_processing_state(True, "Splitting PDF...")
-
-        def task():
-            success, message = self._split_pdf(input_path, output_dir)
-            GLib.idle_add(self._on_task_finished, success, message)
-
-        threading.Thread(target=task, daemon=True).start()
+        self._submit_task(split_pdf, self.selected_pdf, output_dir)
 
     def _run_merge_task(self, output_path):
-        """Run merge task in background."""
-        children = self._get_all_children(self.merge_list_box)
-        pdf_paths = [child.file_path for child in children]
+        """Run merge task in a worker process."""
+        pdf_paths = [item.file_path for item in self.merge_store]
 
         self._set_processing_state(True, "Merging PDFs...")
-
-        def task():
-            success, message = self._merge_pdfs(pdf_paths, output_path)
-            GLib.idle_add(self._on_task_finished, success, message, True)  # Clear merge list on success
-
-        threading.Thread(target=task, daemon=True).start()
+        self._submit_task(merge_pdfs, pdf_paths, output_path, clear_merge=True)
 
     def _run_reorder_task(self, output_path):
-        """Run reorder task in background."""
+        """Run reorder task in a worker process."""
         if not self.reorder_source_path:
             return
 
-        flow_box_children = self._get_all_children(self.reorder_flow_box)
-        new_order_indices = [child.original_page_index for child in flow_box_children if not child.is_deleted]
+        new_order_indices = [widget.original_page_index for widget in self._page_widgets if not widget.is_deleted]
 
         self._set_processing_state(True, "Saving reordered PDF...")
-
-        def task():
-            success, message = self._reorder_pdf_pages(self.reorder_source_path, output_path, new_order_indices)
-            GLib.idle_add(self._on_task_finished, success, message)
-
-        threading.Thread(target=task, daemon=True).start()
-
-    # PDF manipulation methods
-    def _compress_pdf(self, input_path, output_path, quality="ebook"):
-        """Compress PDF using Ghostscript."""
-        try:
-            command = [
-                "gs", "-sDEVICE=pdfwrite", "-dCompatibilityLevel=1.4", 
-                f"-dPDFSETTINGS=/{quality}", "-dNOPAUSE", "-dQUIET", "-dBATCH", 
-                f"-sOutputFile={output_path}", input_path
-            ]
-            subprocess.run(command, check=True, capture_output=True, text=True)
-            return True, "Compression successful."
-        except FileNotFoundError:
-            return False, "Error: Ghostscript (gs) is not installed or not in your PATH."
-        except subprocess.CalledProcessError as e:
-            return False, f"Ghostscript failed: {e.stderr}"
-
-    def _split_pdf(self, input_path, output_dir):
-        """Split PDF into individual pages."""
-        try:
-            reader = PdfReader(input_path)
-            base_name = Path(input_path).stem
-            os.makedirs(output_dir, exist_ok=True)
-
-            for i, page in enumerate(reader.pages):
-                writer = PdfWriter()
-                writer.add_page(page)
-                output_filename = os.path.join(output_dir, f"{base_name}_page_{i + 1}.pdf")
-                with open(output_filename, "wb") as f:
-                    writer.write(f)
-
-            return True, f"Successfully split into {len(reader.pages)} pages."
-        except Exception as e:
-            return False, f"Failed to split PDF: {e}"
-
-    def _merge_pdfs(self, pdf_paths, output_path):
-        """Merge multiple PDF files."""
-        try:
-            merger = PdfWriter()
-            for path in pdf_paths:
-                merger.append(path)
-            merger.write(output_path)
-            merger.close()
-            return True, f"Successfully merged {len(pdf_paths)} files."
-        except Exception as e:
-            return False, f"Failed to merge PDFs: {e}"
-
-    def _reorder_pdf_pages(self, input_path, output_path, new_order_indices):
-        """Reorder PDF pages."""
-        try:
-            reader = PdfReader(input_path)
-            writer = PdfWriter()
-            for index in new_order_indices:
-                writer.add_page(reader.pages[index])
-            with open(output_path, "wb") as f:
-                writer.write(f)
-            return True, "Successfully reordered pages."
-        except Exception as e:
-            return False, f"Failed to reorder PDF: {e}"
+        self._submit_task(reorder_pdf_pages, self.reorder_source_path, output_path, new_order_indices)
 
     def _set_processing_state(self, is_processing, message=""):
         """Set processing state."""
@@ -823,12 +1213,7 @@ class PdfToolWindow(Adw.ApplicationWindow):
 
         if success and clear_merge:
             # Clear merge list after successful merge
-            child = self.merge_list_box.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.merge_list_box.remove(child)
-                child = next_child
-
+            self.merge_store.remove_all()
             self.selected_pdf = None
             self._clear_reorder_view()
             self.reorder_source_path = None
@@ -841,6 +1226,8 @@ class PdfToolWindow(Adw.ApplicationWindow):
         if self.is_processing:
             self.toast_overlay.add_toast(Adw.Toast(title="Cannot close while a task is in progress."))
             return True
+        PREVIEW_POOL.shutdown(wait=False, cancel_futures=True)
+        self._task_pool.shutdown(wait=False, cancel_futures=True)
         return False
 
 class PdfToolApp(Adw.Application):
@@ -850,18 +1237,21 @@ class PdfToolApp(Adw.Application):
 
     def do_activate(self):
         """Activate the application."""
-        if not shutil.which("gs"):
+        if not HAS_PIKEPDF and not GS_PATH:
             dialog = Adw.MessageDialog(
-                transient_for=self.get_active_window(), 
+                transient_for=self.get_active_window(),
                 modal=True,
                 heading="Dependency Missing: Ghostscript",
-                body="This application requires Ghostscript ('gs') for compression. Please install it and ensure it's in your PATH."
+                body="This application requires pikepdf or Ghostscript ('gs') for compression. Please install one of them."
             )
             dialog.add_response("ok", "OK")
             dialog.connect("response", lambda d, r: d.close())
             dialog.present()
             return
 
+        # Trim the persistent thumbnail cache in the background.
+        PREVIEW_POOL.submit(_trim_disk_cache)
+
         win = self.props.active_window
         if not win:
             win = PdfToolWindow(application=self)
@@ -14,11 +14,12 @@ Requires:       gtk4
 Requires:       libadwaita
 Requires:       python3-gobject
 Requires:       ghostscript
-Requires:       poppler-utils
 
 # Python libraries available in Fedora
 Requires:       python3-pypdf
-Requires:       python3-pdf2image
+Requires:       python3-pymupdf
+Requires:       python3-pikepdf
+Requires:       python3-pillow
 
 %description
 I ate PDFs is a modern, user-friendly GTK4 application for manipulating PDF